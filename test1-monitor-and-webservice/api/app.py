@@ -6,29 +6,207 @@ Provides endpoints for querying service status
 """
 
 import os
-import json
+import atexit
+import hashlib
 import logging
-from datetime import datetime
-from flask import Flask, jsonify, request
+import logging.handlers
+import queue
+import threading
+import time
+import orjson
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from flask_caching import Cache
 from elasticsearch import Elasticsearch
+from elasticsearch.helpers import bulk
 
 # Configure logging
+# Records are handed to a background listener so handler I/O stays off request threads
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(
+    logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+)
 logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    # Final formatting happens in the listener's handlers
+    format="%(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
 )
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Response cache configuration (Redis-backed)
+CACHE_TIMEOUT = int(os.getenv("CACHE_TIMEOUT", 15))
+CACHE_STALE_TIMEOUT = int(os.getenv("CACHE_STALE_TIMEOUT", 3600))
+HEALTHCHECK_CACHE_KEY = "healthcheck_all"
+
+cache = Cache(
+    app,
+    config={
+        "CACHE_TYPE": "RedisCache",
+        "CACHE_REDIS_HOST": os.getenv("REDIS_HOST", "redis"),
+        "CACHE_REDIS_PORT": int(os.getenv("REDIS_PORT", 6379)),
+        "CACHE_DEFAULT_TIMEOUT": CACHE_TIMEOUT,
+        "CACHE_KEY_PREFIX": "rbcapp1_",
+    },
+)
 
 # Elasticsearch configuration
 ES_HOST = os.getenv("ELASTICSEARCH_HOST", "elasticsearch:9200")
-logger.info(f"Elasticsearch host: {ES_HOST}")
+logger.info("Elasticsearch host: %s", ES_HOST)
+
+# HTTP connections per Elasticsearch node. The pool lives in each gunicorn
+# worker process, so it only needs one connection per thread in that worker.
+ES_POOL_MAXSIZE = int(os.getenv("ES_POOL_MAXSIZE", os.getenv("GUNICORN_THREADS", 16)))
 
 es_client = None
 
+# Cached Elasticsearch ping result, shared across requests
+PING_CACHE_TTL = float(os.getenv("ES_PING_CACHE_TTL", 3.0))
+_ping_cache = {"ts": 0.0, "ok": False}
+_ping_lock = threading.Lock()
+
+# Background ingest queue for POST /add, flushed to Elasticsearch in batches
+INGEST_QUEUE_SIZE = int(os.getenv("INGEST_QUEUE_SIZE", 10000))
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", 500))
+INGEST_FLUSH_INTERVAL = float(os.getenv("INGEST_FLUSH_INTERVAL", 1.0))
+INGEST_MAX_RETRIES = int(os.getenv("INGEST_MAX_RETRIES", 4))
+_ingest_queue = queue.Queue(maxsize=INGEST_QUEUE_SIZE)
+_ingest_thread = None
+_ingest_lock = threading.Lock()
+# Put on the queue to make the flusher write its current batch and exit
+_INGEST_STOP = object()
+
+# Largest accepted POST /add body, in bytes
+MAX_PAYLOAD_BYTES = int(os.getenv("MAX_PAYLOAD_BYTES", 16384))
+
+# Werkzeug stops reading the request stream past this many bytes, so the
+# limit also holds for chunked bodies that carry no Content-Length. One extra
+# byte is allowed through so add_status can tell a truncated body from one
+# that is exactly MAX_PAYLOAD_BYTES long.
+app.config["MAX_CONTENT_LENGTH"] = MAX_PAYLOAD_BYTES + 1
+
 # Supported services
-SUPPORTED_SERVICES = ["httpd", "rabbitmq", "postgresql"]
+SUPPORTED_SERVICES = ("httpd", "rabbitmq", "postgresql")
+SUPPORTED_SET = frozenset(SUPPORTED_SERVICES)
+INDEX_NAMES = {service: f"rbcapp1-{service}" for service in SUPPORTED_SERVICES}
+
+# Returned when an Elasticsearch query fails, as opposed to None for "no hits"
+QUERY_FAILED = object()
+
+# Document fields read back from Elasticsearch
+STATUS_SOURCE_FIELDS = ["service_status", "host_name", "@timestamp"]
+
+# Response fields kept by Elasticsearch; everything else is stripped server-side
+SEARCH_FILTER_PATH = "hits.hits._source,hits.total.value"
+MSEARCH_FILTER_PATH = (
+    "responses.hits.hits._source,responses.hits.total.value,responses.error"
+)
+
+
+def format_iso_timestamp(t):
+    """Format a Unix timestamp as an ISO 8601 UTC string with microseconds"""
+    usec = int((t % 1) * 1_000_000)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(t)) + f".{usec:06d}Z"
+
+
+def utcnow_iso():
+    """Current UTC time as an ISO 8601 string"""
+    return format_iso_timestamp(time.time())
+
+
+def service_cache_key():
+    """Cache key for a single service status response"""
+    return f"svc_{request.view_args['service']}"
+
+
+def is_cacheable_response(response):
+    """Only cache fresh successful responses; errors and stale copies are retried"""
+    if isinstance(response, tuple):
+        response, status = response[0], response[1]
+    else:
+        status = response.status_code
+    return status == 200 and "Warning" not in response.headers
+
+
+def stale_response(payload):
+    """200 response for a stale payload, flagged so it is never cached"""
+    response = jsonify({**payload, "stale": True})
+    response.headers["Warning"] = '110 - "Response is Stale"'
+    return response
+
+
+def save_stale_response(key, payload):
+    """Store a long-lived shadow copy of a response for use when Elasticsearch is down"""
+    try:
+        cache.set(f"stale_{key}", payload, timeout=CACHE_STALE_TIMEOUT)
+    except Exception as e:
+        logger.warning("Could not store stale copy for %s: %s", key, e)
+
+
+def get_stale_response(key):
+    """Return the last known good payload for a cache key, even if it has expired"""
+    try:
+        return cache.get(f"stale_{key}")
+    except Exception as e:
+        logger.warning("Could not read stale copy for %s: %s", key, e)
+        return None
+
+
+def record_written_status(doc):
+    """
+    Remember a just-written status and drop the cached responses it affects
+    New documents only become searchable after Elasticsearch refreshes, so for
+    CACHE_TIMEOUT seconds reads prefer this copy when it is newer than the hit
+    """
+    service_name = doc["service_name"]
+    written = {
+        "service_status": doc.get("service_status"),
+        "host_name": doc.get("host_name"),
+        "@timestamp": doc["@timestamp"],
+    }
+    try:
+        cache.set(f"written_{service_name}", written, timeout=CACHE_TIMEOUT)
+        cache.delete_many(HEALTHCHECK_CACHE_KEY, f"svc_{service_name}")
+    except Exception as e:
+        logger.warning("Could not update cache for %s: %s", service_name, e)
+
+
+def apply_written_statuses(hits):
+    """Swap in written statuses that are newer than the Elasticsearch hits"""
+    try:
+        written = cache.get_many(*(f"written_{service}" for service in hits))
+    except Exception as e:
+        logger.warning("Could not read written statuses: %s", e)
+        return hits
+
+    merged = dict(hits)
+    for service, copy in zip(hits, written):
+        hit = hits[service]
+        if copy is not None and (
+            hit is None or copy["@timestamp"] > hit.get("@timestamp", "")
+        ):
+            merged[service] = copy
+    return merged
 
 
 def get_elasticsearch_client():
@@ -38,18 +216,41 @@ def get_elasticsearch_client():
     if es_client is None:
         try:
             es_url = f"http://{ES_HOST}" if "://" not in ES_HOST else ES_HOST
-            logger.info(f"Connecting to Elasticsearch at: {es_url}")
-            es_client = Elasticsearch([es_url])
+            logger.info("Connecting to Elasticsearch at: %s", es_url)
+            es_client = Elasticsearch(
+                [es_url],
+                connections_per_node=ES_POOL_MAXSIZE,
+                http_compress=True,
+                retry_on_timeout=True,
+                max_retries=2,
+            )
             logger.info("Elasticsearch client created successfully")
         except Exception as e:
-            logger.error(f"Failed to create Elasticsearch client: {str(e)}")
+            logger.error("Failed to create Elasticsearch client: %s", e)
             es_client = None
 
     return es_client
 
 
 def is_elasticsearch_healthy():
-    """Check if Elasticsearch is healthy"""
+    """Check if Elasticsearch is healthy, reusing a recent ping result"""
+    if time.monotonic() - _ping_cache["ts"] < PING_CACHE_TTL:
+        return _ping_cache["ok"]
+
+    with _ping_lock:
+        # Another thread may have refreshed the result while we waited
+        now = time.monotonic()
+        if now - _ping_cache["ts"] < PING_CACHE_TTL:
+            return _ping_cache["ok"]
+
+        ok = ping_elasticsearch()
+        _ping_cache["ok"] = ok
+        _ping_cache["ts"] = time.monotonic()
+        return ok
+
+
+def ping_elasticsearch():
+    """Ping Elasticsearch and report whether it responded"""
     try:
         es = get_elasticsearch_client()
         if es is None:
@@ -64,37 +265,49 @@ def is_elasticsearch_healthy():
             logger.warning("Elasticsearch ping returned False")
             return False
     except Exception as e:
-        logger.error(f"Error checking Elasticsearch: {str(e)}")
+        logger.error("Error checking Elasticsearch: %s", e)
         return False
 
 
 def get_service_status_from_elasticsearch(service_name):
-    """Retrieve the latest status for a service from Elasticsearch"""
+    """
+    Retrieve the latest status for a service from Elasticsearch
+    Returns the status document, None if there is none, or QUERY_FAILED on error
+    """
     try:
         es = get_elasticsearch_client()
         if es is None:
             logger.error("Cannot query Elasticsearch: client is None")
-            return None
+            return QUERY_FAILED
 
         # Query for the latest status of the service
-        index_name = f"rbcapp1-{service_name}"
+        index_name = INDEX_NAMES[service_name]
 
         result = es.search(
-            index=index_name, size=1, sort=[{"@timestamp": {"order": "desc"}}]
+            index=index_name,
+            size=1,
+            sort=[{"@timestamp": {"order": "desc"}}],
+            source_includes=STATUS_SOURCE_FIELDS,
+            filter_path=SEARCH_FILTER_PATH,
         )
 
-        if result["hits"]["total"]["value"] > 0:
-            hit = result["hits"]["hits"][0]["_source"]
+        # filter_path drops keys that have no content, e.g. hits.hits when empty
+        hits = result.get("hits", {}).get("hits", [])
+        hit = hits[0].get("_source", {}) if hits else None
+        hit = apply_written_statuses({service_name: hit})[service_name]
+        if hit is not None:
             logger.info(
-                f"Retrieved status for {service_name}: {hit.get('service_status', 'UNKNOWN')}"
+                "Retrieved status for %s: %s",
+                service_name,
+                hit.get("service_status", "UNKNOWN"),
             )
             return hit
         else:
-            logger.warning(f"No status found for service: {service_name}")
+            logger.warning("No status found for service: %s", service_name)
             return None
     except Exception as e:
-        logger.error(f"Error querying Elasticsearch for {service_name}: {str(e)}")
-        return None
+        logger.error("Error querying Elasticsearch for %s: %s", service_name, e)
+        return QUERY_FAILED
 
 
 def get_all_services_status():
@@ -107,61 +320,219 @@ def get_all_services_status():
 
         all_statuses = {}
 
-        # get status for each supported service
+        # Build a single msearch body: one header/body pair per service
+        body = []
         for service in SUPPORTED_SERVICES:
-            index_name = f"rbcapp1-{service}"
+            body.append({"index": INDEX_NAMES[service]})
+            body.append(
+                {
+                    "size": 1,
+                    "sort": [{"@timestamp": {"order": "desc"}}],
+                    "_source": STATUS_SOURCE_FIELDS,
+                }
+            )
 
-            try:
-                result = es.search(
-                    index=index_name, size=1, sort=[{"@timestamp": {"order": "desc"}}]
-                )
-
-                if result["hits"]["total"]["value"] > 0:
-                    hit = result["hits"]["hits"][0]["_source"]
-                    all_statuses[service] = {
-                        "status": hit.get("service_status", "UNKNOWN"),
-                        "timestamp": hit.get("@timestamp", "N/A"),
-                    }
-                else:
-                    all_statuses[service] = {"status": "NO_DATA", "timestamp": "N/A"}
-            except Exception as e:
-                logger.warning(f"Could not query {service}: {str(e)}")
+        result = es.msearch(body=body, filter_path=MSEARCH_FILTER_PATH)
+
+        # Responses come back in the same order as the requests
+        latest = {}
+        for service, response in zip(SUPPORTED_SERVICES, result.get("responses", [])):
+            if "error" in response:
+                logger.warning("Could not query %s: %s", service, response["error"])
+                continue
+            hits = response.get("hits", {}).get("hits", [])
+            latest[service] = hits[0].get("_source", {}) if hits else None
+
+        latest = apply_written_statuses(latest)
+
+        for service in SUPPORTED_SERVICES:
+            if service not in latest:
                 all_statuses[service] = {"status": "ERROR", "timestamp": "N/A"}
+            elif latest[service] is not None:
+                hit = latest[service]
+                all_statuses[service] = {
+                    "status": hit.get("service_status", "UNKNOWN"),
+                    "timestamp": hit.get("@timestamp", "N/A"),
+                }
+            else:
+                all_statuses[service] = {"status": "NO_DATA", "timestamp": "N/A"}
 
         return all_statuses
     except Exception as e:
-        logger.error(f"Error querying all services: {str(e)}")
+        logger.error("Error querying all services: %s", e)
         return None
 
 
+def status_document_id(service_name, host_name, timestamp):
+    """Deterministic document id so retried writes overwrite rather than duplicate"""
+    key = f"{service_name}|{host_name}|{timestamp}".encode()
+    return hashlib.blake2b(key, digest_size=12).hexdigest()
+
+
+def start_ingest_flusher():
+    """Start the background bulk flusher for this process if it isn't running"""
+    global _ingest_thread
+
+    with _ingest_lock:
+        if _ingest_thread is None or not _ingest_thread.is_alive():
+            _ingest_thread = threading.Thread(
+                target=run_ingest_flusher, name="ingest-flusher", daemon=True
+            )
+            _ingest_thread.start()
+            logger.info("Ingest flusher started")
+
+
+def stop_ingest_flusher(timeout=30):
+    """Stop the flusher and write everything still queued; safe to call twice"""
+    with _ingest_lock:
+        thread = _ingest_thread
+
+    if thread is not None and thread.is_alive():
+        try:
+            _ingest_queue.put(_INGEST_STOP, timeout=timeout)
+            thread.join(timeout)
+        except queue.Full:
+            logger.warning("Ingest queue still full; draining it directly")
+
+    # Anything left (e.g. queued after the flusher stopped) is written here
+    batch = []
+    while True:
+        try:
+            item = _ingest_queue.get_nowait()
+        except queue.Empty:
+            break
+        if item is not _INGEST_STOP:
+            batch.append(item)
+    if batch:
+        logger.info("Flushing %s queued statuses before exit", len(batch))
+        flush_ingest_batch(batch)
+
+
+def run_ingest_flusher():
+    """Drain queued documents and write them in batches of up to INGEST_BATCH_SIZE"""
+    while True:
+        item = _ingest_queue.get()
+        if item is _INGEST_STOP:
+            return
+
+        batch = [item]
+        stopping = False
+        deadline = time.monotonic() + INGEST_FLUSH_INTERVAL
+
+        while len(batch) < INGEST_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = _ingest_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _INGEST_STOP:
+                stopping = True
+                break
+            batch.append(item)
+
+        flush_ingest_batch(batch)
+        if stopping:
+            return
+
+
+def flush_ingest_batch(batch):
+    """Write (doc_id, document) pairs to Elasticsearch, retrying failures with backoff"""
+    pending = batch
+    for attempt in range(INGEST_MAX_RETRIES + 1):
+        if attempt:
+            time.sleep(min(0.5 * 2 ** (attempt - 1), 10))
+        pending = write_ingest_batch(pending)
+        if not pending:
+            return
+
+    logger.error(
+        "Dropping %s queued statuses after %s retries", len(pending), INGEST_MAX_RETRIES
+    )
+
+
+def write_ingest_batch(batch):
+    """Send one bulk request and return the pairs that should be retried"""
+    es = get_elasticsearch_client()
+    if es is None:
+        logger.error("Cannot flush %s queued statuses: client is None", len(batch))
+        return batch
+
+    actions = [
+        {"_index": INDEX_NAMES[doc["service_name"]], "_id": doc_id, "_source": doc}
+        for doc_id, doc in batch
+    ]
+
+    try:
+        success, errors = bulk(
+            es, actions, request_timeout=10, raise_on_error=False, refresh=False
+        )
+    except Exception as e:
+        logger.error("Error flushing %s queued statuses: %s", len(batch), e)
+        return batch
+
+    if errors:
+        logger.error("Bulk indexing errors: %s", errors)
+    logger.info("Flushed %s queued statuses to Elasticsearch", success)
+
+    failed = {}
+    for item in errors:
+        info = item.get("index", {})
+        failed[info.get("_id")] = info.get("status", 0)
+
+    # Make the new statuses visible to reads before Elasticsearch refreshes
+    with app.app_context():
+        for doc_id, doc in batch:
+            if doc_id not in failed:
+                record_written_status(doc)
+
+    # Rejections (429) and server errors are transient; mapping errors are not
+    return [
+        (doc_id, doc)
+        for doc_id, doc in batch
+        if doc_id in failed and (failed[doc_id] == 429 or failed[doc_id] >= 500)
+    ]
+
+
+# Write out queued statuses when the process exits (gunicorn also calls
+# stop_ingest_flusher from its worker_exit hook)
+atexit.register(stop_ingest_flusher)
+
+
+def unknown_service_response(service_name, services_key):
+    """Build the 400 response for an unknown service"""
+    body = orjson.dumps(
+        {"error": f"Unknown service: {service_name}", services_key: SUPPORTED_SERVICES}
+    )
+    return Response(body, status=400, mimetype="application/json")
+
+
+# The API information never changes, so it is serialized once at import time
+_INDEX_DICT = {
+    "service": "rbcapp1-api",
+    "version": "2.0",
+    "description": "Service Status Management API",
+    "endpoints": {
+        "/health": "GET - API health check",
+        "/healthcheck": "GET - Get all services status",
+        "/healthcheck/<service>": "GET - Get specific service status",
+        "/add": "POST - Add/Insert service status to Elasticsearch",
+    },
+    "supported_services": SUPPORTED_SERVICES,
+}
+_INDEX_BODY = orjson.dumps(_INDEX_DICT)
+
+
 @app.route("/", methods=["GET"])
 def index():
     """Root endpoint - API information"""
-    logger.info(f"{request.method} {request.path}")
-    return (
-        jsonify(
-            {
-                "service": "rbcapp1-api",
-                "version": "2.0",
-                "description": "Service Status Management API",
-                "endpoints": {
-                    "/health": "GET - API health check",
-                    "/healthcheck": "GET - Get all services status",
-                    "/healthcheck/<service>": "GET - Get specific service status",
-                    "/add": "POST - Add/Insert service status to Elasticsearch",
-                },
-                "supported_services": SUPPORTED_SERVICES,
-            }
-        ),
-        200,
-    )
+    return Response(_INDEX_BODY, status=200, mimetype="application/json")
 
 
 @app.route("/health", methods=["GET"])
 def health():
     """Health check endpoint - Verifies Elasticsearch connectivity"""
-    logger.info(f"{request.method} {request.path}")
-
     if is_elasticsearch_healthy():
         logger.info("Health status: HEALTHY")
         return jsonify({"status": "healthy"}), 200
@@ -171,16 +542,23 @@ def health():
 
 
 @app.route("/healthcheck", methods=["GET"])
+@cache.cached(
+    timeout=CACHE_TIMEOUT,
+    key_prefix=HEALTHCHECK_CACHE_KEY,
+    response_filter=is_cacheable_response,
+)
 def healthcheck():
     """
     GET /healthcheck - Returns all application statuses
     Returns: Dictionary with status for each service (UP, DOWN, UNKNOWN, NO_DATA)
     """
-    logger.info(f"{request.method} {request.path}")
-
     # First check if Elasticsearch is healthy
     if not is_elasticsearch_healthy():
         logger.warning("Cannot retrieve statuses: Elasticsearch unavailable")
+        stale = get_stale_response(HEALTHCHECK_CACHE_KEY)
+        if stale is not None:
+            logger.info("Serving stale status for all services")
+            return stale_response(stale)
         return jsonify({"error": "Elasticsearch unavailable", "status": "UNKNOWN"}), 503
 
     # Get all services status
@@ -188,6 +566,10 @@ def healthcheck():
 
     if all_statuses is None:
         logger.error("Failed to retrieve services status")
+        stale = get_stale_response(HEALTHCHECK_CACHE_KEY)
+        if stale is not None:
+            logger.info("Serving stale status for all services")
+            return stale_response(stale)
         return (
             jsonify({"error": "Failed to retrieve services status", "status": "ERROR"}),
             500,
@@ -195,39 +577,40 @@ def healthcheck():
 
     # Build response with all services
     response = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utcnow_iso(),
         "services": all_statuses,
     }
 
-    logger.info(f"Returning status for all services: {all_statuses}")
+    save_stale_response(HEALTHCHECK_CACHE_KEY, response)
+
+    logger.info("Returning status for all services: %s", all_statuses)
     return jsonify(response), 200
 
 
 @app.route("/healthcheck/<service>", methods=["GET"])
+@cache.cached(
+    timeout=CACHE_TIMEOUT,
+    key_prefix=service_cache_key,
+    response_filter=is_cacheable_response,
+)
 def healthcheck_service(service):
     """
     GET /healthcheck/<service> - Returns specific service status
     Args: service - Service name (httpd, rabbitmq, postgresql)
     Returns: Service status (UP, DOWN, UNKNOWN, NO_DATA)
     """
-    logger.info(f"{request.method} {request.path} - service: {service}")
-
     # Validate service name
-    if service not in SUPPORTED_SERVICES:
-        logger.warning(f"Unknown service requested: {service}")
-        return (
-            jsonify(
-                {
-                    "error": f"Unknown service: {service}",
-                    "available_services": SUPPORTED_SERVICES,
-                }
-            ),
-            400,
-        )
+    if service not in SUPPORTED_SET:
+        logger.warning("Unknown service requested: %s", service)
+        return unknown_service_response(service, "available_services")
 
     # Check if Elasticsearch is healthy
     if not is_elasticsearch_healthy():
-        logger.warning(f"Cannot retrieve {service} status: Elasticsearch unavailable")
+        logger.warning("Cannot retrieve %s status: Elasticsearch unavailable", service)
+        stale = get_stale_response(f"svc_{service}")
+        if stale is not None:
+            logger.info("Serving stale status for %s", service)
+            return stale_response(stale)
         return (
             jsonify(
                 {
@@ -242,8 +625,24 @@ def healthcheck_service(service):
     # Get service status from Elasticsearch
     service_status = get_service_status_from_elasticsearch(service)
 
+    if service_status is QUERY_FAILED:
+        stale = get_stale_response(f"svc_{service}")
+        if stale is not None:
+            logger.info("Serving stale status for %s", service)
+            return stale_response(stale)
+        return (
+            jsonify(
+                {
+                    "service": service,
+                    "status": "UNKNOWN",
+                    "reason": "Elasticsearch query failed",
+                }
+            ),
+            503,
+        )
+
     if service_status is None:
-        logger.info(f"No data found for {service}")
+        logger.info("No data found for %s", service)
         return (
             jsonify(
                 {
@@ -262,7 +661,9 @@ def healthcheck_service(service):
         "timestamp": service_status.get("@timestamp", "N/A"),
     }
 
-    logger.info(f"Returning status for {service}: {response}")
+    save_stale_response(f"svc_{service}", response)
+
+    logger.info("Returning status for %s: %s", service, response)
     return jsonify(response), 200
 
 
@@ -270,6 +671,8 @@ def healthcheck_service(service):
 def add_status():
     """
     POST /add - Accept JSON payload and store in Elasticsearch
+    The document is queued and written in the background (202 Accepted);
+    use /add?sync=1 to wait for Elasticsearch to confirm the write (201 Created)
     Expected JSON format:
     {
         "service_name": "httpd",
@@ -277,22 +680,31 @@ def add_status():
         "host_name": "host1"
     }
     """
-    logger.info(f"{request.method} {request.path}")
+    # Reads at most MAX_PAYLOAD_BYTES + 1 bytes, even for chunked bodies
+    raw = request.get_data(cache=False)
+    if len(raw) > MAX_PAYLOAD_BYTES:
+        logger.error("Request body too large: more than %s bytes", MAX_PAYLOAD_BYTES)
+        return jsonify({"error": "Request body too large"}), 413
 
     # Get JSON payload
-    if not request.is_json:
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
         logger.error("Request is not JSON")
         return jsonify({"error": "Request must be JSON"}), 400
 
-    data = request.get_json()
-    logger.info(f"Received JSON: {data}")
+    if not isinstance(data, dict):
+        logger.error("Request JSON is not an object")
+        return jsonify({"error": "Request must be a JSON object"}), 400
+
+    logger.debug("Received JSON: %s", data)
 
     # Validate required fields
     required_fields = ["service_name", "service_status", "host_name"]
     missing_fields = [field for field in required_fields if field not in data]
 
     if missing_fields:
-        logger.error(f"Missing required fields: {missing_fields}")
+        logger.error("Missing required fields: %s", missing_fields)
         return (
             jsonify(
                 {
@@ -306,40 +718,65 @@ def add_status():
     service_name = data.get("service_name")
 
     # Validate service name
-    if service_name not in SUPPORTED_SERVICES:
-        logger.error(f"Unknown service: {service_name}")
+    if not isinstance(service_name, str) or service_name not in SUPPORTED_SET:
+        logger.error("Unknown service: %s", service_name)
+        return unknown_service_response(service_name, "supported_services")
+
+    # Check if Elasticsearch is healthy
+    if not is_elasticsearch_healthy():
+        logger.error("Cannot insert status: Elasticsearch unavailable")
+        return jsonify({"error": "Elasticsearch unavailable", "status": "FAILED"}), 503
+
+    # Add timestamp
+    data["@timestamp"] = utcnow_iso()
+    data["timestamp"] = data["@timestamp"]
+
+    doc_id = status_document_id(service_name, data["host_name"], data["@timestamp"])
+
+    if request.args.get("sync", "0").lower() not in ("1", "true"):
+        # Normally started by gunicorn's post_fork hook; this covers other servers
+        if _ingest_thread is None:
+            start_ingest_flusher()
+
+        try:
+            _ingest_queue.put_nowait((doc_id, data))
+        except queue.Full:
+            logger.error("Cannot queue status: ingest queue is full")
+            return jsonify({"error": "Ingest queue full", "status": "FAILED"}), 503
+
+        logger.info("Queued status for %s", service_name)
         return (
             jsonify(
                 {
-                    "error": f"Unknown service: {service_name}",
-                    "supported_services": SUPPORTED_SERVICES,
+                    "message": f"Status for {service_name} queued for Elasticsearch",
+                    "service": service_name,
+                    "status": data.get("service_status"),
+                    "host_name": data.get("host_name"),
+                    "timestamp": data["@timestamp"],
+                    "elasticsearch_id": doc_id,
                 }
             ),
-            400,
+            202,
         )
 
-    # Check if Elasticsearch is healthy
-    if not is_elasticsearch_healthy():
-        logger.error("Cannot insert status: Elasticsearch unavailable")
-        return jsonify({"error": "Elasticsearch unavailable", "status": "FAILED"}), 503
-
     try:
         es = get_elasticsearch_client()
 
-        # Add timestamp
-        data["@timestamp"] = datetime.utcnow().isoformat() + "Z"
-        data["timestamp"] = data["@timestamp"]
-
         # Create index name based on service
-        index_name = f"rbcapp1-{service_name}"
+        index_name = INDEX_NAMES[service_name]
 
         # Insert into Elasticsearch
-        result = es.index(index=index_name, body=data)
+        result = es.index(
+            index=index_name, id=doc_id, body=data, refresh=False, op_type="index"
+        )
 
         logger.info(
-            f"Successfully inserted status for {service_name} into {index_name}"
+            "Successfully inserted status for %s into %s", service_name, index_name
         )
-        logger.info(f"Elasticsearch response: {result}")
+        logger.debug("Elasticsearch response: %s", result)
+
+        # Make the new status visible to reads before Elasticsearch refreshes
+        record_written_status(data)
 
         return (
             jsonify(
@@ -355,7 +792,7 @@ def add_status():
             201,
         )
     except Exception as e:
-        logger.error(f"Error inserting status into Elasticsearch: {str(e)}")
+        logger.error("Error inserting status into Elasticsearch: %s", e)
         return (
             jsonify(
                 {"error": f"Failed to insert status: {str(e)}", "status": "FAILED"}
@@ -367,26 +804,46 @@ def add_status():
 @app.before_request
 def log_request():
     """Log all incoming requests"""
-    logger.info(f"{request.method} {request.path}")
+    if logger.isEnabledFor(logging.INFO):
+        if request.view_args:
+            logger.info("%s %s - %s", request.method, request.path, request.view_args)
+        else:
+            logger.info("%s %s", request.method, request.path)
 
 
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
-    logger.warning(f"404 error: {request.path} not found")
+    logger.warning("404 error: %s not found", request.path)
     return jsonify({"error": "Endpoint not found", "path": request.path}), 404
 
 
+@app.errorhandler(413)
+def payload_too_large(error):
+    """Handle 413 errors"""
+    logger.error("Request body too large: %s bytes", request.content_length)
+    return jsonify({"error": "Request body too large"}), 413
+
+
 @app.errorhandler(500)
 def server_error(error):
     """Handle 500 errors"""
-    logger.error(f"500 error: {str(error)}")
+    logger.error("500 error: %s", error)
     return jsonify({"error": "Internal server error", "message": str(error)}), 500
 
 
 if __name__ == "__main__":
+    # The Flask development server is only for local development;
+    # production runs under gunicorn (see gunicorn.conf.py and wsgi.py)
+    if os.getenv("FLASK_ENV", "production") != "development":
+        logger.error(
+            "Refusing to start the development server in production. "
+            "Use: gunicorn -c gunicorn.conf.py wsgi:app"
+        )
+        raise SystemExit(1)
+
     logger.info("=" * 60)
-    logger.info("rbcapp1 REST API starting")
+    logger.info("rbcapp1 REST API starting (development server)")
     logger.info("=" * 60)
 
     # Test Elasticsearch connection on startup
@@ -401,10 +858,8 @@ if __name__ == "__main__":
     api_host = os.getenv("API_HOST", "0.0.0.0")
     api_port = int(os.getenv("API_PORT", 5000))
 
-    logger.info(f"Starting Flask on {api_host}:{api_port}")
+    start_ingest_flusher()
 
-    app.run(
-        host=api_host,
-        port=api_port,
-        debug=os.getenv("FLASK_ENV", "production") == "development",
-    )
+    logger.info("Starting Flask on %s:%s", api_host, api_port)
+
+    app.run(host=api_host, port=api_port, debug=True)
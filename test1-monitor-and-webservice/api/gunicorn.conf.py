@@ -0,0 +1,33 @@
+"""
+Gunicorn configuration for the rbcapp1 REST API
+Threaded workers let concurrent requests share the Elasticsearch connection pool
+"""
+
+import os
+
+bind = f"{os.getenv('API_HOST', '0.0.0.0')}:{os.getenv('API_PORT', '5000')}"
+workers = int(os.getenv("GUNICORN_WORKERS", 4))
+threads = int(os.getenv("GUNICORN_THREADS", 16))
+worker_class = "gthread"
+timeout = 120
+
+
+def post_fork(server, worker):
+    """Warm each worker's Elasticsearch pool and start its ingest flusher"""
+    from app import is_elasticsearch_healthy, start_ingest_flusher
+
+    start_ingest_flusher()
+
+    if is_elasticsearch_healthy():
+        server.log.info(f"Worker {worker.pid}: Elasticsearch connection verified")
+    else:
+        server.log.warning(
+            f"Worker {worker.pid}: Elasticsearch not responding (will retry on requests)"
+        )
+
+
+def worker_exit(server, worker):
+    """Write statuses still queued in this worker before it exits"""
+    from app import stop_ingest_flusher
+
+    stop_ingest_flusher()
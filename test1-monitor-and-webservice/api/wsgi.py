@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for the rbcapp1 REST API
+Run with: gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+from app import app
+
+__all__ = ["app"]
@@ -1,28 +1,60 @@
 #!/usr/bin/env python3
-import os, json, logging, sys, time
-from datetime import datetime
+import os, atexit, logging, logging.handlers, queue, sys, time
 from pathlib import Path
 
+import orjson
+from elasticsearch import Elasticsearch
+from elasticsearch.helpers import bulk
+
 LOG_DIR = Path("/var/log/rbcapp1")
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
+# Records are handed to a background listener so file I/O stays off the monitor loop
+_log_queue = queue.SimpleQueue()
+_log_formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+_log_handlers = [
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler(LOG_DIR / "monitor.log"),
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
 logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(LOG_DIR / "monitor.log"),
-    ],
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    # Final formatting happens in the listener's handlers
+    format="%(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
 )
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 logger = logging.getLogger(__name__)
 
+ES_HOST = os.getenv("ELASTICSEARCH_HOST", "elasticsearch:9200")
+# Statuses are indexed directly by default. Status files are for setups where a
+# file shipper loads them into Elasticsearch, in which case turn off
+# INDEX_STATUSES so each status is only indexed once.
+INDEX_STATUSES = os.getenv("INDEX_STATUSES", "true").lower() == "true"
+WRITE_STATUS_FILES = os.getenv("WRITE_STATUS_FILES", "false").lower() == "true"
+
+
+def format_iso_timestamp(t):
+    """Format a Unix timestamp as an ISO 8601 UTC string with microseconds"""
+    usec = int((t % 1) * 1_000_000)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(t)) + f".{usec:06d}Z"
+
 
 class ServiceMonitor:
     def __init__(self):
         self.output_dir = "/var/tmp/rbcapp1-status"
         os.makedirs(self.output_dir, exist_ok=True)
-        logger.info("Monitor initialized")
+        self.hostname = os.uname().nodename
+        self.index_statuses = INDEX_STATUSES
+        self.write_status_files = WRITE_STATUS_FILES
+        es_url = f"http://{ES_HOST}" if "://" not in ES_HOST else ES_HOST
+        self.es = Elasticsearch([es_url])
+        logger.info("Monitor initialized (Elasticsearch: %s)", es_url)
         self.service_status_config = {
             "httpd": "UP",
             "rabbitmq": "DOWN",  # Initially simulate failure
@@ -32,28 +64,55 @@ class ServiceMonitor:
     def get_service_status(self, service_name):
         return self.service_status_config.get(service_name, "UNKNOWN")
 
-    def generate_status_json(self, service_name, status):
-        timestamp = datetime.utcnow().isoformat() + "Z"
+    def generate_status_json(self, service_name, status, now=None):
+        # now is a Unix timestamp shared by every service in a cycle
+        now = now or time.time()
+        timestamp = format_iso_timestamp(now)
         payload = {
             "service_name": service_name,
             "service_status": status,
-            "host_name": os.uname().nodename,
+            "host_name": self.hostname,
             "timestamp": timestamp,
             "@timestamp": timestamp,
         }
 
-        filename = f"{service_name}-{status}-{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}.json"
-        filepath = os.path.join(self.output_dir, filename)
-
-        with open(filepath, "w") as f:
-            json.dump(payload, f, indent=2)
-        logger.info(f"Generated: {filename} -> {status}")
+        if self.write_status_files:
+            file_stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(now))
+            filename = f"{service_name}-{status}-{file_stamp}.json"
+            filepath = os.path.join(self.output_dir, filename)
+
+            with open(filepath, "w") as f:
+                f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode())
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Generated: %s -> %s", filename, status)
+
+        return payload
+
+    def send_to_elasticsearch(self, payloads):
+        """Index all status documents for a cycle in a single bulk request"""
+        actions = [
+            {"_index": f"rbcapp1-{payload['service_name']}", "_source": payload}
+            for payload in payloads
+        ]
+        try:
+            success, errors = bulk(
+                self.es, actions, raise_on_error=False, request_timeout=10
+            )
+            if errors:
+                logger.warning("Bulk indexing errors: %s", errors)
+            logger.info("Indexed %s status documents in Elasticsearch", success)
+        except Exception as e:
+            logger.error("Failed to send statuses to Elasticsearch: %s", e)
 
     def monitor_all_services(self):
         services = list(self.service_status_config.keys())
+        now = time.time()
+        payloads = []
         for service in services:
             status = self.get_service_status(service)
-            self.generate_status_json(service, status)
+            payloads.append(self.generate_status_json(service, status, now))
+        if self.index_statuses:
+            self.send_to_elasticsearch(payloads)
         logger.info("Monitor cycle complete")
 
 
@@ -68,15 +127,17 @@ def main():
 
         while True:
             cycle += 1
-            logger.info(f"Starting monitoring cycle #{cycle}")
+            # Schedule against an absolute deadline so work time doesn't drift the cadence
+            next_tick = time.monotonic() + 60
+            logger.info("Starting monitoring cycle #%s", cycle)
             monitor.monitor_all_services()
-            logger.info(f"Cycle #{cycle} complete. Waiting 60 seconds...")
-            time.sleep(60)
+            logger.info("Cycle #%s complete. Waiting for next cycle...", cycle)
+            time.sleep(max(0, next_tick - time.monotonic()))
 
     except KeyboardInterrupt:
         logger.info("Monitor interrupted. Shutting down...")
     except Exception as e:
-        logger.error(f"Critical error: {str(e)}", exc_info=True)
+        logger.error("Critical error: %s", e, exc_info=True)
         raise
 
 
@@ -48,6 +48,18 @@ print_info() {
     echo -e "${BLUE}ℹ $1${NC}"
 }
 
+# The monitor indexes its own simulated statuses (rabbitmq DOWN) into the same
+# rbcapp1-* indices, so keep it paused while tests write and read back statuses
+pause_monitor() {
+    docker compose pause monitor > /dev/null 2>&1
+}
+
+resume_monitor() {
+    docker compose unpause monitor > /dev/null 2>&1
+}
+
+trap resume_monitor EXIT
+
 # ============================================================================
 # SECTION 1: SERVICE VERIFICATION
 # ============================================================================
@@ -146,10 +158,11 @@ section_api_endpoints() {
 
 section_post_updates() {
     print_header "SECTION 3: POST/UPDATE TESTS"
+    pause_monitor
     
     # Test 1: Update single service
     print_test "Test: POST /add (update httpd to UP)"
-    RESPONSE=$(curl -s -X POST "http://localhost:5001/add" \
+    RESPONSE=$(curl -s -X POST "http://localhost:5001/add?sync=1" \
         -H "Content-Type: application/json" \
         -d '{"service_name":"httpd","service_status":"UP","host_name":"test"}')
     
@@ -162,16 +175,18 @@ section_post_updates() {
     
     # Test 2: Verify update
     print_test "Test: Verify httpd status changed"
-    HTTPD_STATUS=$(curl -s http://localhost:5001/healthcheck/httpd | jq -r '.status' 2>/dev/null)
-    if [[ "$HTTPD_STATUS" == "UP" ]]; then
+    HTTPD=$(curl -s http://localhost:5001/healthcheck/httpd)
+    HTTPD_STATUS=$(echo "$HTTPD" | jq -r '.status' 2>/dev/null)
+    HTTPD_HOST=$(echo "$HTTPD" | jq -r '.host_name' 2>/dev/null)
+    if [[ "$HTTPD_STATUS" == "UP" && "$HTTPD_HOST" == "test" ]]; then
         print_pass "httpd status changed to UP"
     else
-        print_fail "httpd status not changed (status: $HTTPD_STATUS)"
+        print_fail "httpd status not changed (status: $HTTPD_STATUS, host: $HTTPD_HOST)"
     fi
     
     # Test 3: Update rabbitmq
     print_test "Test: POST /add (update rabbitmq to UP)"
-    RESPONSE=$(curl -s -X POST "http://localhost:5001/add" \
+    RESPONSE=$(curl -s -X POST "http://localhost:5001/add?sync=1" \
         -H "Content-Type: application/json" \
         -d '{"service_name":"rabbitmq","service_status":"UP","host_name":"test"}')
     
@@ -184,7 +199,7 @@ section_post_updates() {
     
     # Test 4: Update postgresql
     print_test "Test: POST /add (update postgresql to UP)"
-    RESPONSE=$(curl -s -X POST "http://localhost:5001/add" \
+    RESPONSE=$(curl -s -X POST "http://localhost:5001/add?sync=1" \
         -H "Content-Type: application/json" \
         -d '{"service_name":"postgresql","service_status":"UP","host_name":"test"}')
     
@@ -194,6 +209,20 @@ section_post_updates() {
     else
         print_fail "postgresql update failed"
     fi
+    
+    # Test 5: Queued (asynchronous) update
+    print_test "Test: POST /add (queued update of httpd)"
+    HTTP_CODE=$(curl -s -o /dev/null -w "%{http_code}" -X POST "http://localhost:5001/add" \
+        -H "Content-Type: application/json" \
+        -d '{"service_name":"httpd","service_status":"UP","host_name":"test"}')
+    if [[ "$HTTP_CODE" == "202" ]]; then
+        print_pass "Queued update returns 202"
+        sleep 2
+    else
+        print_fail "Queued update should return 202 (got $HTTP_CODE)"
+    fi
+    
+    resume_monitor
 }
 
 # ============================================================================
@@ -332,11 +361,12 @@ section_elasticsearch_tests() {
 
 section_integration_tests() {
     print_header "SECTION 7: INTEGRATION TESTS"
+    pause_monitor
     
     print_test "Test: Complete flow - Update all services to DOWN"
     
     for service in httpd rabbitmq postgresql; do
-        curl -s -X POST "http://localhost:5001/add" \
+        curl -s -X POST "http://localhost:5001/add?sync=1" \
             -H "Content-Type: application/json" \
             -d "{\"service_name\":\"$service\",\"service_status\":\"DOWN\",\"host_name\":\"test\"}" > /dev/null
     done
@@ -353,7 +383,7 @@ section_integration_tests() {
     print_test "Test: Complete flow - Recovery (update all to UP)"
     
     for service in httpd rabbitmq postgresql; do
-        curl -s -X POST "http://localhost:5001/add" \
+        curl -s -X POST "http://localhost:5001/add?sync=1" \
             -H "Content-Type: application/json" \
             -d "{\"service_name\":\"$service\",\"service_status\":\"UP\",\"host_name\":\"test\"}" > /dev/null
     done
@@ -369,11 +399,11 @@ section_integration_tests() {
     
     print_test "Test: Partial outage (httpd and postgresql DOWN, rabbitmq UP)"
     
-    curl -s -X POST "http://localhost:5001/add" \
+    curl -s -X POST "http://localhost:5001/add?sync=1" \
         -H "Content-Type: application/json" \
         -d '{"service_name":"httpd","service_status":"DOWN","host_name":"test"}' > /dev/null
     
-    curl -s -X POST "http://localhost:5001/add" \
+    curl -s -X POST "http://localhost:5001/add?sync=1" \
         -H "Content-Type: application/json" \
         -d '{"service_name":"postgresql","service_status":"DOWN","host_name":"test"}' > /dev/null
     
@@ -388,6 +418,8 @@ section_integration_tests() {
     else
         print_fail "Partial outage scenario failed (httpd:$HTTPD, rabbitmq:$RABBITMQ, postgresql:$POSTGRESQL)"
     fi
+    
+    resume_monitor
 }
 
 # ============================================================================
@@ -4,11 +4,76 @@ TEST3: Real Estate Price Per Square Foot Analysis
 Script to filter properties sold for less than average price per square foot
 """
 
+import numpy as np
 import pandas as pd
 import sys
 import os
 from pathlib import Path
 
+# pyarrow parses CSV files considerably faster; fall back to the C parser without it
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+# Numba JIT-compiles the price per square foot kernel when it is installed;
+# below NUMBA_MIN_ROWS the compile cost outweighs the gain over NumPy
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+NUMBA_MIN_ROWS = 1_000_000
+
+
+def price_per_sqft_numpy(price, sqft):
+    """
+    Calculate price per square foot with NumPy
+    
+    Returns:
+        tuple: (price_per_sqft_array, mean_over_valid_rows, valid_row_count)
+    """
+    valid_mask = sqft > 0
+    pps = np.where(valid_mask, price / np.where(valid_mask, sqft, 1), 0.0)
+    valid_count = int(valid_mask.sum())
+    # Like pandas, the mean skips rows with a missing price
+    valid_pps = pps[valid_mask]
+    valid_pps = valid_pps[~np.isnan(valid_pps)]
+    mean = valid_pps.mean() if valid_pps.size else np.nan
+    return pps, mean, valid_count
+
+
+if njit is not None:
+    # fastmath is left off: it assumes no NaN, which would break the isnan check
+    @njit(parallel=True, cache=True)
+    def price_per_sqft_numba(price, sqft):
+        """Fused single-pass version of price_per_sqft_numpy"""
+        n = price.shape[0]
+        pps = np.empty(n)
+        total = 0.0
+        valid_count = 0
+        mean_count = 0
+        for i in prange(n):
+            if sqft[i] > 0:
+                v = price[i] / sqft[i]
+                pps[i] = v
+                valid_count += 1
+                if not np.isnan(v):
+                    total += v
+                    mean_count += 1
+            else:
+                pps[i] = 0.0
+        mean = total / mean_count if mean_count else np.nan
+        return pps, mean, valid_count
+
+
+def calculate_price_per_sqft(price, sqft):
+    """Calculate price per square foot, using the Numba kernel for large inputs"""
+    if njit is not None and price.shape[0] >= NUMBA_MIN_ROWS:
+        return price_per_sqft_numba(price, sqft)
+    return price_per_sqft_numpy(price, sqft)
+
 
 def analyze_real_estate_data(input_file, output_file=None):
     """
@@ -34,7 +99,7 @@ def analyze_real_estate_data(input_file, output_file=None):
     
     # Step 2: Read CSV file
     try:
-        df = pd.read_csv(input_file)
+        df = pd.read_csv(input_file, engine=CSV_ENGINE)
         print(f"Loaded {len(df)} properties.")
     except Exception as e:
         print(f"Error reading CSV: {str(e)}")
@@ -50,30 +115,30 @@ def analyze_real_estate_data(input_file, output_file=None):
     
     # Step 4: Calculate price per square foot
     # Handle division by zero (properties with 0 sq__ft)
-    df['price_per_sqft'] = df.apply(
-        lambda row: row['price'] / row['sq__ft'] if row['sq__ft'] > 0 else 0,
-        axis=1
+    pps, average_price_per_sqft, valid_count = calculate_price_per_sqft(
+        df['price'].to_numpy(), df['sq__ft'].to_numpy()
     )
+    df['price_per_sqft'] = pps
     
     print("\nData overview")
     print(f"Total properties: {len(df)}")
     print(f"Columns: {list(df.columns)}")
     
-    # Step 5: Calculate average price per square foot
+    # Step 5: Average price per square foot (computed alongside Step 4)
     # Only include properties with sq__ft > 0 in average calculation
-    valid_properties = df[df['sq__ft'] > 0]
-    average_price_per_sqft = valid_properties['price_per_sqft'].mean()
-    
-    print(f"Properties with valid square footage: {len(valid_properties)}")
+    print(f"Properties with valid square footage: {valid_count}")
     print(f"Average price per square foot: {average_price_per_sqft:.2f}")
     
     # Step 6: Filter properties below average
-    below_average = df[df['price_per_sqft'] < average_price_per_sqft].copy()
-    above_average = df[df['price_per_sqft'] >= average_price_per_sqft].copy()
+    # Rows with a missing price fall in neither group
+    below_mask = pps < average_price_per_sqft
+    below_average = df[below_mask]
+    above_pps = pps[pps >= average_price_per_sqft]
+    above_count = above_pps.size
     
     print("\nFiltering results")
     print(f"Properties below average price per square foot: {len(below_average)}")
-    print(f"Properties at or above average price per square foot: {len(above_average)}")
+    print(f"Properties at or above average price per square foot: {above_count}")
     if len(df) > 0:
         print(f"Percentage below average: {len(below_average) / len(df) * 100:.1f}%")
     
@@ -101,17 +166,23 @@ def analyze_real_estate_data(input_file, output_file=None):
         print("No data to display.")
     
     # Step 10: Calculate statistics
+    # All below-average statistics are computed in a single aggregation pass
+    if not below_average.empty:
+        below_stats = below_average[['price', 'sq__ft', 'price_per_sqft']].agg(['mean', 'min', 'max'])
+    else:
+        below_stats = None
+    
     stats = {
         'total_properties': len(df),
         'below_average_count': len(below_average),
-        'above_average_count': len(above_average),
+        'above_average_count': above_count,
         'average_price_per_sqft': average_price_per_sqft,
-        'below_avg_mean_price': below_average['price'].mean() if not below_average.empty else 0,
-        'below_avg_mean_sqft': below_average['sq__ft'].mean() if not below_average.empty else 0,
-        'below_avg_mean_price_per_sqft': below_average['price_per_sqft'].mean() if not below_average.empty else 0,
-        'below_avg_min_price_per_sqft': below_average['price_per_sqft'].min() if not below_average.empty else 0,
-        'below_avg_max_price_per_sqft': below_average['price_per_sqft'].max() if not below_average.empty else 0,
-        'above_avg_mean_price_per_sqft': above_average['price_per_sqft'].mean() if not above_average.empty else 0,
+        'below_avg_mean_price': below_stats.at['mean', 'price'] if below_stats is not None else 0,
+        'below_avg_mean_sqft': below_stats.at['mean', 'sq__ft'] if below_stats is not None else 0,
+        'below_avg_mean_price_per_sqft': below_stats.at['mean', 'price_per_sqft'] if below_stats is not None else 0,
+        'below_avg_min_price_per_sqft': below_stats.at['min', 'price_per_sqft'] if below_stats is not None else 0,
+        'below_avg_max_price_per_sqft': below_stats.at['max', 'price_per_sqft'] if below_stats is not None else 0,
+        'above_avg_mean_price_per_sqft': above_pps.mean() if above_pps.size else 0,
     }
     
     # Step 11: Display statistics